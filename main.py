@@ -5,64 +5,414 @@ Autor: Sistema de gestión Docker
 Versión: 1.0
 """
 
+import asyncio
 import subprocess
 import sys
+import threading
 import json
 import os
-from typing import List, Dict, Optional
+import shutil
+import time
+from typing import Any, Callable, List, Dict, Optional, Sequence, Tuple
+
+try:
+    import docker
+    import requests
+    # Errores del SDK; si el daemon desaparece, requests lanza sus propias excepciones
+    SDK_ERRORS = (docker.errors.DockerException, requests.exceptions.RequestException)
+except ImportError:  # SDK opcional: sin él se usa la CLI de docker
+    docker = None
+    SDK_ERRORS = ()
+
+# Segundos durante los que se reutiliza la salida de una consulta de solo lectura
+CACHE_TTL = 1.5
+
+# Segundos durante los que un listado de contenedores recién mostrado se reutiliza
+LIST_REUSE_SECONDS = 2.0
+
+# Subcomandos que modifican el estado de Docker e invalidan la caché
+MUTATING_VERBS = frozenset({'run', 'rm', 'rmi', 'stop', 'start', 'restart', 'pull', 'build', 'prune'})
+
+# Secuencia ANSI que borra la pantalla y mueve el cursor al inicio
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Textos de los menús, construidos una sola vez
+HEADER = "=" * 60 + "\n🐳 DOCKER MANAGEMENT CLI\n{version}\n" + "=" * 60 + "\n"
+
+MAIN_MENU = (
+    "\n📋 MENÚ PRINCIPAL:\n"
+    "1. 📦 Gestión de Imágenes\n"
+    "2. 🐳 Gestión de Contenedores\n"
+    "3. 🔧 Información del Sistema\n"
+    "4. 🚪 Salir\n"
+    + "-" * 30 + "\n"
+)
+
+IMAGE_MENU = (
+    "\n📦 GESTIÓN DE IMÁGENES:\n"
+    "1. 📋 Listar todas las imágenes\n"
+    "2. ⬇️ Descargar imagen\n"
+    "3. 🔨 Construir imagen\n"
+    "4. 🗑️ Eliminar imagen\n"
+    "5. ⬅️ Volver al menú principal\n"
+    + "-" * 35 + "\n"
+)
+
+CONTAINER_MENU = (
+    "\n🐳 GESTIÓN DE CONTENEDORES:\n"
+    "1. 📋 Listar contenedores activos\n"
+    "2. 📋 Listar todos los contenedores\n"
+    "3. 🚀 Ejecutar nuevo contenedor\n"
+    "4. ▶️ Iniciar contenedor\n"
+    "5. ⏹️ Detener contenedor\n"
+    "6. 🔄 Reiniciar contenedor\n"
+    "7. 🗑️ Eliminar contenedor\n"
+    "8. 📄 Ver logs de contenedor\n"
+    "9. 💻 Ejecutar comando en contenedor\n"
+    "10. ⬅️ Volver al menú principal\n"
+    + "-" * 40 + "\n"
+)
+
+SYSTEM_MENU = (
+    "\n🔧 INFORMACIÓN DEL SISTEMA:\n"
+    "1. 📊 Información del sistema Docker\n"
+    "2. 💾 Uso de disco\n"
+    "3. 🧹 Limpiar sistema\n"
+    "4. ⬅️ Volver al menú principal\n"
+    + "-" * 35 + "\n"
+)
+
+# Opciones válidas de cada menú
+MAIN_CHOICES = frozenset({'1', '2', '3', '4'})
+IMAGE_CHOICES = frozenset({'1', '2', '3', '4', '5'})
+CONTAINER_CHOICES = frozenset({'1', '2', '3', '4', '5', '6', '7', '8', '9', '10'})
+SYSTEM_CHOICES = frozenset({'1', '2', '3', '4'})
+
+
+def format_size(size: float) -> str:
+    """Formatea un tamaño en bytes igual que la CLI de docker (unidades decimales, 4 cifras significativas)"""
+    for unit in ('B', 'kB', 'MB', 'GB', 'TB'):
+        text = f"{size:.4g}"
+        # Un valor que al redondear llega a 1000 pasa a la unidad siguiente
+        if float(text) < 1000:
+            return f"{text}{unit}"
+        size /= 1000
+    return f"{size:.4g}PB"
+
+
+def format_since(timestamp: int) -> str:
+    """Formatea una fecha de creación como tiempo transcurrido, igual que `CreatedSince` de la CLI de docker"""
+    seconds = max(0, int(time.time() - timestamp))
+    minutes = seconds // 60
+    # Docker redondea a la hora más cercana antes de aplicar los umbrales
+    hours = (seconds + 1800) // 3600
+    if seconds < 1:
+        since = "Less than a second"
+    elif seconds == 1:
+        since = "1 second"
+    elif seconds < 60:
+        since = f"{seconds} seconds"
+    elif minutes == 1:
+        since = "About a minute"
+    elif minutes < 60:
+        since = f"{minutes} minutes"
+    elif hours == 1:
+        since = "About an hour"
+    elif hours < 48:
+        since = f"{hours} hours"
+    elif hours < 24 * 7 * 2:
+        since = f"{hours // 24} days"
+    elif hours < 24 * 30 * 2:
+        since = f"{hours // 24 // 7} weeks"
+    elif hours < 24 * 365 * 2:
+        since = f"{hours // 24 // 30} months"
+    else:
+        since = f"{seconds // 3600 // 24 // 365} years"
+    return f"{since} ago"
+
+
+def format_ports(ports: List[Dict]) -> str:
+    """Formatea los puertos devueltos por la API como lo hace `docker ps`"""
+    mappings = []
+    for port in ports:
+        private = f"{port['PrivatePort']}/{port['Type']}"
+        if port.get('PublicPort'):
+            mappings.append(f"{port.get('IP', '0.0.0.0')}:{port['PublicPort']}->{private}")
+        else:
+            mappings.append(private)
+    return ", ".join(mappings)
+
+
+def split_ids(text: str) -> List[str]:
+    """Separa una lista de identificadores escrita con espacios y/o comas"""
+    return text.replace(',', ' ').split()
+
+
+def parse_ndjson(output: str) -> List[Dict]:
+    """Convierte la salida de `--format '{{json .}}'` (un objeto JSON por línea) en una lista de filas"""
+    return [json.loads(line) for line in output.splitlines() if line]
+
+
+def emit(*lines: str):
+    """Escribe varias líneas en la salida estándar con una sola escritura"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def render_table(rows: List[Dict], columns: List[Tuple[str, str]]) -> str:
+    """Construye una tabla alineada con las filas; `columns` son pares (encabezado, clave)"""
+    widths = [len(header) for header, _ in columns]
+    for row in rows:
+        for i, (_, key) in enumerate(columns):
+            widths[i] = max(widths[i], len(str(row.get(key, ''))))
+
+    lines = ["   ".join(header.ljust(width) for (header, _), width in zip(columns, widths)).rstrip()]
+    for row in rows:
+        lines.append("   ".join(str(row.get(key, '')).ljust(width)
+                                for (_, key), width in zip(columns, widths)).rstrip())
+    return "\n".join(lines)
 
 
 class DockerManager:
     """Clase principal para la gestión de Docker"""
 
+    _EVENTS_ARGV = ('docker', 'events', '--format', '{{json .}}',
+                    '--filter', 'type=container', '--filter', 'type=image')
+
     def __init__(self):
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        # Se incrementa con cada invalidación para detectar listados desactualizados
+        self.cache_generation = 0
+        # El listener de eventos invalida la caché desde otro hilo
+        self._cache_lock = threading.Lock()
+        # Ruta absoluta del ejecutable para no buscarlo en el PATH en cada comando
+        self.docker_bin = shutil.which('docker') or 'docker'
+        self.docker_version = ''
+        self._events_proc: Optional[subprocess.Popen] = None
         self.check_docker_installed()
+        self.client = self.connect_client()
 
     def check_docker_installed(self):
         """Verifica si Docker está instalado y funcionando"""
         try:
-            result = subprocess.run(['docker', '--version'],
+            result = subprocess.run([self.docker_bin, '--version'],
                                     capture_output=True, text=True, check=True)
-            print(f"✅ Docker detectado: {result.stdout.strip()}")
+            self.docker_version = result.stdout.strip()
+            print(f"✅ Docker detectado: {self.docker_version}")
         except (subprocess.CalledProcessError, FileNotFoundError):
             print("❌ Docker no está instalado o no está en el PATH")
             sys.exit(1)
 
-    def run_command(self, command: List[str]) -> Optional[str]:
+    def connect_client(self):
+        """Abre una conexión persistente con el daemon usando el SDK de Docker (si está instalado)"""
+        if docker is None:
+            return None
+        try:
+            client = docker.from_env()
+            client.ping()
+            return client
+        except SDK_ERRORS:
+            return None
+
+    def invalidate_cache(self):
+        """Descarta los resultados de consultas guardados"""
+        with self._cache_lock:
+            self._cache.clear()
+            self.cache_generation += 1
+
+    def _cached(self, key: Tuple, loader: Callable[[], Any], ttl: float) -> Any:
+        """Retorna el valor guardado para `key` si tiene menos de `ttl` segundos o lo vuelve a obtener"""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            generation = self.cache_generation
+        if entry and now - entry[0] < ttl:
+            return entry[1]
+
+        value = loader()
+        with self._cache_lock:
+            # Si hubo una invalidación mientras se consultaba, el valor puede estar desactualizado
+            if value is not None and generation == self.cache_generation:
+                self._cache[key] = (now, value)
+        return value
+
+    def cached_api(self, func, *args, ttl: float = CACHE_TTL, **kwargs) -> Any:
+        """Consulta de solo lectura al SDK cuyo resultado se reutiliza durante `ttl` segundos"""
+        key = ('api', func.__name__, args, tuple(sorted(kwargs.items())))
+        return self._cached(key, lambda: func(*args, **kwargs), ttl)
+
+    def cached_run_command(self, command: Sequence[str], ttl: float = CACHE_TTL) -> Optional[str]:
+        """Como run_command, pero reutiliza la salida de consultas de solo lectura durante `ttl` segundos"""
+        if command[1] not in ('ps', 'images'):
+            return self.run_command(command)
+        return self._cached(tuple(command), lambda: self.run_command(command), ttl)
+
+    def cached_query(self, command: Sequence[str], ttl: float = CACHE_TTL) -> subprocess.CompletedProcess:
+        """Ejecuta una consulta de solo lectura y reutiliza su salida y código de salida durante `ttl` segundos"""
+        return self._cached(('query', *command),
+                            lambda: subprocess.run(self.resolve_command(command), capture_output=True, text=True),
+                            ttl)
+
+    def _event_listener(self, proc: subprocess.Popen):
+        """Lee `docker events` e invalida la caché cuando cambian contenedores o imágenes"""
+        with proc.stdout:
+            for _ in proc.stdout:
+                self.invalidate_cache()
+        proc.wait()
+
+    def start_event_listener(self):
+        """Inicia en segundo plano la escucha de eventos de Docker mientras el menú espera al usuario"""
+        try:
+            # En su propia sesión, para que el Ctrl+C del usuario (p. ej. al seguir logs) no lo detenga
+            self._events_proc = subprocess.Popen(self.resolve_command(self._EVENTS_ARGV),
+                                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                                 start_new_session=True)
+        except OSError:
+            # Sin eventos la caché sigue caducando por TTL
+            return
+        threading.Thread(target=self._event_listener, args=(self._events_proc,), daemon=True).start()
+
+    def stop_event_listener(self):
+        """Detiene el proceso `docker events` si sigue en ejecución"""
+        if self._events_proc and self._events_proc.poll() is None:
+            self._events_proc.terminate()
+
+    def resolve_command(self, command: Sequence[str]) -> List[str]:
+        """Sustituye `docker` por la ruta absoluta del ejecutable detectada al inicio"""
+        if command[0] == 'docker':
+            return [self.docker_bin, *command[1:]]
+        return list(command)
+
+    def _invalidate_if_mutating(self, command: Sequence[str]):
+        """Invalida la caché si el comando modifica el estado de Docker"""
+        if MUTATING_VERBS.intersection(command[1:3]):
+            self.invalidate_cache()
+
+    def run_api(self, func, *args, **kwargs) -> bool:
+        """Ejecuta una llamada al daemon mediante el SDK y retorna si tuvo éxito"""
+        self.invalidate_cache()
+        try:
+            func(*args, **kwargs)
+            return True
+        except SDK_ERRORS as e:
+            print(f"❌ Error ejecutando comando: {e}")
+            return False
+
+    def run_command(self, command: Sequence[str]) -> Optional[str]:
         """Ejecuta un comando de Docker y retorna el resultado"""
+        self._invalidate_if_mutating(command)
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
+            result = subprocess.run(self.resolve_command(command),
+                                    capture_output=True, text=True, check=True)
             return result.stdout.strip()
         except subprocess.CalledProcessError as e:
             print(f"❌ Error ejecutando comando: {e.stderr.strip()}")
             return None
 
+    def run_command_multi(self, command: List[str], targets: List[str]) -> List[bool]:
+        """Ejecuta un comando de Docker sobre varios objetivos en una sola invocación
+
+        Solo sirve para verbos que repiten en stdout cada objetivo procesado
+        (stop, start, restart, rm); `rmi` informa con líneas Untagged/Deleted.
+        """
+        self._invalidate_if_mutating(command)
+        result = subprocess.run(self.resolve_command(command + targets), capture_output=True, text=True)
+        if result.returncode == 0:
+            return [True] * len(targets)
+
+        print(f"❌ Error ejecutando comando: {result.stderr.strip()}")
+        # Ante un fallo parcial, Docker imprime en stdout los objetivos procesados con éxito
+        done = set(result.stdout.split())
+        return [target in done for target in targets]
+
     def run_command_interactive(self, command: List[str]) -> bool:
         """Ejecuta un comando de Docker de forma interactiva"""
+        self._invalidate_if_mutating(command)
         try:
-            result = subprocess.run(command, check=True)
+            result = subprocess.run(self.resolve_command(command), check=True)
             return result.returncode == 0
         except subprocess.CalledProcessError:
             return False
 
+    def stream_command(self, command: List[str]) -> bool:
+        """Ejecuta un comando de Docker mostrando su salida línea a línea; Ctrl+C lo detiene"""
+        proc = subprocess.Popen(self.resolve_command(command), stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, text=True, bufsize=1)
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            proc.terminate()
+            print()
+        finally:
+            proc.stdout.close()
+        return proc.wait() == 0
+
 
 class ImageManager:
     """Gestión de imágenes Docker"""
 
+    _IMAGES_ARGV = ('docker', 'images', '--format', '{{json .}}')
+
     def __init__(self, docker_manager: DockerManager):
         self.dm = docker_manager
 
-    def list_images(self):
-        """Lista todas las imágenes Docker"""
-        print("\n📦 IMÁGENES DOCKER DISPONIBLES:")
-        print("-" * 80)
+    def _snapshot(self) -> Optional[List[Dict]]:
+        """Obtiene las imágenes con una única llamada a Docker"""
+        if self.dm.client:
+            try:
+                images = self.dm.cached_api(self.dm.client.api.images)
+            except SDK_ERRORS as e:
+                print(f"❌ Error ejecutando comando: {e}")
+                return None
+
+            rows = []
+            for image in images:
+                for repo_tag in image.get('RepoTags') or ['<none>:<none>']:
+                    repository, _, tag = repo_tag.rpartition(':')
+                    rows.append({'Repository': repository, 'Tag': tag,
+                                 'ID': image['Id'].split(':')[-1][:12], 'Size': format_size(image['Size']),
+                                 'CreatedSince': format_since(image['Created'])})
+            return rows
+
+        result = self.dm.cached_run_command(self._IMAGES_ARGV)
+        if result is None:
+            return None
+        return parse_ndjson(result)
+
+    def _is_listed(self, query: str, images: Optional[List[Dict]]) -> bool:
+        """Comprueba contra el listado ya obtenido si un ID (o prefijo), repositorio o repositorio:tag existe"""
+        if images is None:
+            # Sin listado no se puede validar; Docker resolverá el identificador
+            return True
+
+        if '/' in query or '@' in query:
+            # Referencias con registro, ruta o digest: Docker las normaliza y las valida
+            return True
+
+        # El listado muestra IDs cortos (12 caracteres); se compara con ese prefijo
+        id_prefix = (query.split(':', 1)[1] if query.startswith('sha256:') else query)[:12]
+        for image in images:
+            if id_prefix and image['ID'].startswith(id_prefix):
+                return True
+            if query == f"{image['Repository']}:{image['Tag']}":
+                return True
+            # Un repositorio sin tag equivale a :latest
+            if query == image['Repository'] and image['Tag'] == 'latest':
+                return True
+        return False
+
+    def list_images(self) -> Optional[List[Dict]]:
+        """Lista todas las imágenes Docker y retorna el listado obtenido"""
+        images = self._snapshot()
+        if images is None:
+            emit("\n📦 IMÁGENES DOCKER DISPONIBLES:", "-" * 80, "No se pudieron listar las imágenes")
+            return None
 
-        result = self.dm.run_command(['docker', 'images', '--format',
-                                      'table {{.Repository}}\t{{.Tag}}\t{{.ID}}\t{{.Size}}\t{{.CreatedSince}}'])
-        if result:
-            print(result)
-        else:
-            print("No se pudieron listar las imágenes")
+        emit("\n📦 IMÁGENES DOCKER DISPONIBLES:", "-" * 80,
+             render_table(images, [('REPOSITORY', 'Repository'), ('TAG', 'Tag'), ('IMAGE ID', 'ID'),
+                                   ('SIZE', 'Size'), ('CREATED', 'CreatedSince')]))
+        return images
 
     def pull_image(self):
         """Descarga una imagen desde Docker Hub"""
@@ -81,35 +431,59 @@ class ImageManager:
 
     def remove_image(self):
         """Elimina una imagen Docker"""
-        self.list_images()
+        images = self.list_images()
         print("\n🗑️ ELIMINAR IMAGEN")
-        image_id = input("Ingresa el ID o nombre de la imagen a eliminar: ").strip()
+        image_id = input("Ingresa el ID o nombre de la imagen a eliminar (separa varias con espacios): ").strip()
 
-        if not image_id:
+        image_ids = split_ids(image_id)
+        if not image_ids:
             print("❌ ID de imagen no puede estar vacío")
             return
 
-        confirm = input(f"¿Estás seguro de eliminar la imagen {image_id}? (s/N): ").strip().lower()
+        unknown = [image for image in image_ids if not self._is_listed(image, images)]
+        for image in unknown:
+            print(f"❌ No se encontró la imagen {image}")
+        if unknown:
+            return
+
+        if len(image_ids) > 1:
+            names = ', '.join(image_ids)
+            confirm = input(f"¿Estás seguro de eliminar las imágenes {names}? (s/N): ").strip().lower()
+            if confirm == 's':
+                # Una sola invocación de `docker rmi`; ante un fallo, su stderr indica qué imágenes fallaron
+                if self.dm.run_command(['docker', 'rmi', *image_ids]) is not None:
+                    print(f"✅ Imágenes {names} eliminadas exitosamente")
+                else:
+                    print(f"❌ Error al eliminar las imágenes {names}")
+            return
+
+        image = image_ids[0]
+        confirm = input(f"¿Estás seguro de eliminar la imagen {image}? (s/N): ").strip().lower()
         if confirm == 's':
-            if self.dm.run_command(['docker', 'rmi', image_id]):
-                print(f"✅ Imagen {image_id} eliminada exitosamente")
+            if self.dm.run_command(['docker', 'rmi', image]):
+                print(f"✅ Imagen {image} eliminada exitosamente")
             else:
-                print(f"❌ Error al eliminar la imagen {image_id}")
+                print(f"❌ Error al eliminar la imagen {image}")
 
     def build_image(self):
         """Construye una imagen desde un Dockerfile"""
         print("\n🔨 CONSTRUIR IMAGEN")
         dockerfile_path = input("Ruta del directorio con Dockerfile (. para actual): ").strip() or "."
-        image_name = input("Nombre para la nueva imagen: ").strip()
 
-        if not image_name:
-            print("❌ Nombre de imagen no puede estar vacío")
+        if not os.path.isdir(dockerfile_path):
+            print(f"❌ El directorio {dockerfile_path} no existe")
             return
 
-        if not os.path.exists(f"{dockerfile_path}/Dockerfile"):
+        if not os.path.isfile(os.path.join(dockerfile_path, 'Dockerfile')):
             print(f"❌ No se encontró Dockerfile en {dockerfile_path}")
             return
 
+        image_name = input("Nombre para la nueva imagen: ").strip()
+
+        if not image_name:
+            print("❌ Nombre de imagen no puede estar vacío")
+            return
+
         print(f"Construyendo imagen {image_name}...")
         if self.dm.run_command_interactive(['docker', 'build', '-t', image_name, dockerfile_path]):
             print(f"✅ Imagen {image_name} construida exitosamente")
@@ -120,25 +494,94 @@ class ImageManager:
 class ContainerManager:
     """Gestión de contenedores Docker"""
 
+    _PS_ARGV = ('docker', 'ps', '--no-trunc', '--format', '{{json .}}')
+    _PS_ALL_ARGV = _PS_ARGV[:2] + ('-a',) + _PS_ARGV[2:]
+
     def __init__(self, docker_manager: DockerManager):
         self.dm = docker_manager
+        # Último listado mostrado: (momento, todos los contenedores, generación de caché, filas)
+        self._last_list_ts = 0.0
+        self._last_list_all = True
+        self._last_list_generation = -1
+        self._last_list_rows: Optional[List[Dict]] = None
+
+    def _snapshot(self, all_containers: bool = True) -> Optional[List[Dict]]:
+        """Obtiene los contenedores con una única llamada a Docker"""
+        if self.dm.client:
+            try:
+                containers = self.dm.cached_api(self.dm.client.api.containers, all=all_containers)
+            except SDK_ERRORS as e:
+                print(f"❌ Error ejecutando comando: {e}")
+                return None
+
+            return [{'ID': c['Id'], 'Names': c['Names'][0].lstrip('/'), 'Image': c['Image'],
+                     'Status': c['Status'], 'Ports': format_ports(c['Ports'])}
+                    for c in containers]
+
+        result = self.dm.cached_run_command(self._PS_ALL_ARGV if all_containers else self._PS_ARGV)
+        if result is None:
+            return None
+        return parse_ndjson(result)
 
-    def list_containers(self, all_containers=True):
-        """Lista contenedores Docker"""
-        status = "TODOS LOS CONTENEDORES" if all_containers else "CONTENEDORES ACTIVOS"
-        print(f"\n🐳 {status}:")
-        print("-" * 100)
+    def _resolve(self, query: str, containers: Optional[List[Dict]]) -> Optional[str]:
+        """Resuelve un nombre exacto o un ID (o prefijo único) contra el listado y retorna el ID completo"""
+        if containers is None:
+            # Sin listado no se puede validar; Docker resolverá el identificador
+            return query
 
-        cmd = ['docker', 'ps', '--format',
-               'table {{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}\t{{.Ports}}']
-        if all_containers:
-            cmd.insert(2, '-a')
+        for container in containers:
+            if query == container['Names']:
+                return container['ID']
 
-        result = self.dm.run_command(cmd)
-        if result:
-            print(result)
+        # Igual que Docker, los prefijos solo se aceptan para IDs, nunca para nombres
+        matches = [c['ID'] for c in containers if c['ID'].startswith(query)]
+        if len(matches) == 1:
+            return matches[0]
+
+        if matches:
+            print(f"❌ El identificador {query} es ambiguo ({len(matches)} coincidencias)")
         else:
-            print("No se pudieron listar los contenedores")
+            print(f"❌ No se encontró el contenedor {query}")
+        return None
+
+    def _display(self, query: str, full_id: str, containers: Optional[List[Dict]]) -> str:
+        """Texto con el que se muestra al usuario el contenedor resuelto a partir de lo que escribió"""
+        for container in containers or []:
+            if container['ID'] == full_id:
+                if query == container['Names']:
+                    return query
+                return f"{container['Names']} ({full_id[:12]})"
+        return query
+
+    def list_containers(self, all_containers=True) -> Optional[List[Dict]]:
+        """Lista contenedores Docker y retorna el listado obtenido"""
+        status = "TODOS LOS CONTENEDORES" if all_containers else "CONTENEDORES ACTIVOS"
+        # Se toma antes de consultar: una invalidación durante la consulta deja el listado como desactualizado
+        generation = self.dm.cache_generation
+        containers = self._snapshot(all_containers)
+        if containers is None:
+            emit(f"\n🐳 {status}:", "-" * 100, "No se pudieron listar los contenedores")
+            return None
+
+        emit(f"\n🐳 {status}:", "-" * 100,
+             render_table([dict(container, ID=container['ID'][:12]) for container in containers],
+                          [('CONTAINER ID', 'ID'), ('NAMES', 'Names'), ('IMAGE', 'Image'),
+                           ('STATUS', 'Status'), ('PORTS', 'Ports')]))
+
+        self._last_list_ts = time.monotonic()
+        self._last_list_all = all_containers
+        self._last_list_generation = generation
+        self._last_list_rows = containers
+        return containers
+
+    def _maybe_list(self, all_containers=True) -> Optional[List[Dict]]:
+        """Reutiliza el listado recién mostrado si sigue vigente; si no, vuelve a listar"""
+        if (self._last_list_rows is not None
+                and self._last_list_all == all_containers
+                and self._last_list_generation == self.dm.cache_generation
+                and time.monotonic() - self._last_list_ts < LIST_REUSE_SECONDS):
+            return self._last_list_rows
+        return self.list_containers(all_containers)
 
     def run_container(self):
         """Ejecuta un nuevo contenedor"""
@@ -167,72 +610,193 @@ class ContainerManager:
         else:
             print("❌ Error al iniciar el contenedor")
 
+    def apply_action(self, action: str, container_id: str) -> bool:
+        """Aplica stop/start/restart/rm sobre un contenedor, por el SDK si está disponible"""
+        if self.dm.client:
+            api = self.dm.client.api
+            if action == 'rm':
+                return self.dm.run_api(api.remove_container, container_id, force=True)
+            return self.dm.run_api(getattr(api, action), container_id)
+
+        return self.dm.run_command(self._action_command(action, container_id)) is not None
+
+    def _action_command(self, action: str, *container_ids: str) -> List[str]:
+        """Construye el comando de la CLI para una acción sobre uno o varios contenedores"""
+        if action == 'rm':
+            # Forzar eliminación si está corriendo
+            return ['docker', 'rm', '-f', *container_ids]
+        return ['docker', action, *container_ids]
+
+    async def _apply_many(self, action: str, container_ids: List[str]) -> List[bool]:
+        """Aplica una acción mediante el SDK a varios contenedores en paralelo"""
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(loop.run_in_executor(None, self.apply_action, action, container_id)
+                                      for container_id in container_ids))
+
+    def _resolve_many(self, queries: List[str],
+                      containers: Optional[List[Dict]]) -> Optional[List[Tuple[str, str]]]:
+        """Resuelve varios identificadores en pares (texto, ID completo) sin repetir; None si alguno falla"""
+        resolved: Dict[str, str] = {}
+        for query in queries:
+            full_id = self._resolve(query, containers)
+            if not full_id:
+                return None
+            resolved.setdefault(full_id, query)
+        return [(query, full_id) for full_id, query in resolved.items()]
+
+    def _bulk_action(self, action: str, resolved: List[Tuple[str, str]],
+                     containers: Optional[List[Dict]] = None) -> Dict[str, bool]:
+        """Aplica una acción a pares (texto, ID completo) ya resueltos y retorna el resultado de cada uno"""
+        full_ids = [full_id for _, full_id in resolved]
+
+        if self.dm.client:
+            results = asyncio.run(self._apply_many(action, full_ids))
+        else:
+            # Una sola invocación de la CLI para todos los contenedores
+            results = self.dm.run_command_multi(self._action_command(action), full_ids)
+
+        return {self._display(query, full_id, containers): ok for (query, full_id), ok in zip(resolved, results)}
+
+    def bulk_stop(self, container_ids: str, containers: Optional[List[Dict]] = None) -> Optional[Dict[str, bool]]:
+        """Detiene varios contenedores a la vez"""
+        resolved = self._resolve_many(split_ids(container_ids), containers)
+        return None if resolved is None else self._bulk_action('stop', resolved, containers)
+
+    def bulk_start(self, container_ids: str, containers: Optional[List[Dict]] = None) -> Optional[Dict[str, bool]]:
+        """Inicia varios contenedores a la vez"""
+        resolved = self._resolve_many(split_ids(container_ids), containers)
+        return None if resolved is None else self._bulk_action('start', resolved, containers)
+
+    def bulk_restart(self, container_ids: str, containers: Optional[List[Dict]] = None) -> Optional[Dict[str, bool]]:
+        """Reinicia varios contenedores a la vez"""
+        resolved = self._resolve_many(split_ids(container_ids), containers)
+        return None if resolved is None else self._bulk_action('restart', resolved, containers)
+
+    def bulk_remove(self, container_ids: str, containers: Optional[List[Dict]] = None) -> Optional[Dict[str, bool]]:
+        """Elimina varios contenedores a la vez"""
+        resolved = self._resolve_many(split_ids(container_ids), containers)
+        return None if resolved is None else self._bulk_action('rm', resolved, containers)
+
+    def _report_bulk(self, results: Optional[Dict[str, bool]], done: str, verb: str):
+        """Muestra el resultado de una acción aplicada a varios contenedores"""
+        for container_id, ok in (results or {}).items():
+            if ok:
+                print(f"✅ Contenedor {container_id} {done}")
+            else:
+                print(f"❌ Error al {verb} el contenedor {container_id}")
+
     def stop_container(self):
         """Detiene un contenedor"""
-        self.list_containers()
+        containers = self._maybe_list()
         print("\n⏹️ DETENER CONTENEDOR")
-        container_id = input("ID o nombre del contenedor a detener: ").strip()
+        container_id = input("ID o nombre del contenedor a detener (separa varios con espacios): ").strip()
 
-        if not container_id:
+        queries = split_ids(container_id)
+        if not queries:
             print("❌ ID de contenedor no puede estar vacío")
             return
 
-        if self.dm.run_command(['docker', 'stop', container_id]):
-            print(f"✅ Contenedor {container_id} detenido")
+        if len(queries) > 1:
+            self._report_bulk(self.bulk_stop(container_id, containers), "detenido", "detener")
+            return
+
+        full_id = self._resolve(queries[0], containers)
+        if not full_id:
+            return
+
+        label = self._display(queries[0], full_id, containers)
+        if self.apply_action('stop', full_id):
+            print(f"✅ Contenedor {label} detenido")
         else:
-            print(f"❌ Error al detener el contenedor {container_id}")
+            print(f"❌ Error al detener el contenedor {label}")
 
     def start_container(self):
         """Inicia un contenedor detenido"""
-        self.list_containers()
+        containers = self._maybe_list()
         print("\n▶️ INICIAR CONTENEDOR")
-        container_id = input("ID o nombre del contenedor a iniciar: ").strip()
+        container_id = input("ID o nombre del contenedor a iniciar (separa varios con espacios): ").strip()
 
-        if not container_id:
+        queries = split_ids(container_id)
+        if not queries:
             print("❌ ID de contenedor no puede estar vacío")
             return
 
-        if self.dm.run_command(['docker', 'start', container_id]):
-            print(f"✅ Contenedor {container_id} iniciado")
+        if len(queries) > 1:
+            self._report_bulk(self.bulk_start(container_id, containers), "iniciado", "iniciar")
+            return
+
+        full_id = self._resolve(queries[0], containers)
+        if not full_id:
+            return
+
+        label = self._display(queries[0], full_id, containers)
+        if self.apply_action('start', full_id):
+            print(f"✅ Contenedor {label} iniciado")
         else:
-            print(f"❌ Error al iniciar el contenedor {container_id}")
+            print(f"❌ Error al iniciar el contenedor {label}")
 
     def restart_container(self):
         """Reinicia un contenedor"""
-        self.list_containers()
+        containers = self._maybe_list()
         print("\n🔄 REINICIAR CONTENEDOR")
-        container_id = input("ID o nombre del contenedor a reiniciar: ").strip()
+        container_id = input("ID o nombre del contenedor a reiniciar (separa varios con espacios): ").strip()
 
-        if not container_id:
+        queries = split_ids(container_id)
+        if not queries:
             print("❌ ID de contenedor no puede estar vacío")
             return
 
-        if self.dm.run_command(['docker', 'restart', container_id]):
-            print(f"✅ Contenedor {container_id} reiniciado")
+        if len(queries) > 1:
+            self._report_bulk(self.bulk_restart(container_id, containers), "reiniciado", "reiniciar")
+            return
+
+        full_id = self._resolve(queries[0], containers)
+        if not full_id:
+            return
+
+        label = self._display(queries[0], full_id, containers)
+        if self.apply_action('restart', full_id):
+            print(f"✅ Contenedor {label} reiniciado")
         else:
-            print(f"❌ Error al reiniciar el contenedor {container_id}")
+            print(f"❌ Error al reiniciar el contenedor {label}")
 
     def remove_container(self):
         """Elimina un contenedor"""
-        self.list_containers()
+        containers = self._maybe_list()
         print("\n🗑️ ELIMINAR CONTENEDOR")
-        container_id = input("ID o nombre del contenedor a eliminar: ").strip()
+        container_id = input("ID o nombre del contenedor a eliminar (separa varios con espacios): ").strip()
 
-        if not container_id:
+        queries = split_ids(container_id)
+        if not queries:
             print("❌ ID de contenedor no puede estar vacío")
             return
 
-        confirm = input(f"¿Estás seguro de eliminar el contenedor {container_id}? (s/N): ").strip().lower()
+        if len(queries) > 1:
+            resolved = self._resolve_many(queries, containers)
+            if resolved is None:
+                return
+
+            labels = [self._display(query, full_id, containers) for query, full_id in resolved]
+            confirm = input(f"¿Estás seguro de eliminar los contenedores {', '.join(labels)}? (s/N): ")
+            if confirm.strip().lower() == 's':
+                self._report_bulk(self._bulk_action('rm', resolved, containers), "eliminado", "eliminar")
+            return
+
+        full_id = self._resolve(queries[0], containers)
+        if not full_id:
+            return
+
+        label = self._display(queries[0], full_id, containers)
+        confirm = input(f"¿Estás seguro de eliminar el contenedor {label}? (s/N): ").strip().lower()
         if confirm == 's':
-            # Forzar eliminación si está corriendo
-            if self.dm.run_command(['docker', 'rm', '-f', container_id]):
-                print(f"✅ Contenedor {container_id} eliminado")
+            if self.apply_action('rm', full_id):
+                print(f"✅ Contenedor {label} eliminado")
             else:
-                print(f"❌ Error al eliminar el contenedor {container_id}")
+                print(f"❌ Error al eliminar el contenedor {label}")
 
     def view_logs(self):
         """Ver logs de un contenedor"""
-        self.list_containers()
+        containers = self._maybe_list()
         print("\n📋 VER LOGS")
         container_id = input("ID o nombre del contenedor: ").strip()
 
@@ -240,13 +804,23 @@ class ContainerManager:
             print("❌ ID de contenedor no puede estar vacío")
             return
 
-        print(f"\n📋 Logs del contenedor {container_id}:")
-        print("-" * 60)
-        self.dm.run_command_interactive(['docker', 'logs', '--tail', '50', container_id])
+        full_id = self._resolve(container_id, containers)
+        if not full_id:
+            return
+
+        follow = input("¿Seguir los logs en tiempo real? (s/N): ").strip().lower() == 's'
+        title = f"\n📋 Logs del contenedor {self._display(container_id, full_id, containers)}:"
+        if follow:
+            cmd = ['docker', 'logs', '-f', '--tail', '50', full_id]
+            emit(title, "(Ctrl+C para dejar de seguir los logs)", "-" * 60)
+        else:
+            cmd = ['docker', 'logs', '--tail', '50', full_id]
+            emit(title, "-" * 60)
+        self.dm.stream_command(cmd)
 
     def exec_container(self):
         """Ejecutar comando en contenedor"""
-        self.list_containers(all_containers=False)
+        containers = self._maybe_list(all_containers=False)
         print("\n💻 EJECUTAR COMANDO EN CONTENEDOR")
         container_id = input("ID o nombre del contenedor: ").strip()
 
@@ -254,8 +828,12 @@ class ContainerManager:
             print("❌ ID de contenedor no puede estar vacío")
             return
 
+        full_id = self._resolve(container_id, containers)
+        if not full_id:
+            return
+
         print("Iniciando shell interactivo en el contenedor...")
-        self.dm.run_command_interactive(['docker', 'exec', '-it', container_id, '/bin/bash'])
+        self.dm.run_command_interactive(['docker', 'exec', '-it', full_id, '/bin/bash'])
 
 
 class SystemManager:
@@ -266,18 +844,59 @@ class SystemManager:
 
     def system_info(self):
         """Muestra información del sistema Docker"""
-        print("\n🔧 INFORMACIÓN DEL SISTEMA DOCKER:")
-        print("-" * 50)
-        self.dm.run_command_interactive(['docker', 'system', 'info'])
+        header = ("\n🔧 INFORMACIÓN DEL SISTEMA DOCKER:", "-" * 50)
+
+        if self.dm.client:
+            try:
+                info = self.dm.cached_api(self.dm.client.api.info)
+            except SDK_ERRORS as e:
+                emit(*header, f"❌ Error ejecutando comando: {e}")
+                return
+            emit(*header, *self._info_lines(info))
+            return
+
+        self._show_query(header, ['docker', 'system', 'info'])
+
+    def _show_query(self, header: Tuple[str, ...], command: List[str]):
+        """Muestra bajo su encabezado la salida de una consulta de la CLI, también cuando el comando falla"""
+        result = self.dm.cached_query(command)
+        lines = list(header)
+        if result.stdout.strip():
+            lines.append(result.stdout.rstrip())
+        # `docker info` puede salir con error y aun así mostrar la sección Client; los avisos van por stderr
+        if result.returncode != 0:
+            lines.append(f"❌ Error ejecutando comando: {result.stderr.strip()}")
+        elif result.stderr.strip():
+            lines.append(result.stderr.rstrip())
+        emit(*lines)
+
+    def _info_lines(self, data: Any, indent: int = 0) -> List[str]:
+        """Convierte la respuesta de la API en líneas jerárquicas de clave: valor"""
+        prefix = " " * indent
+        lines = []
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if isinstance(value, (dict, list)) and value:
+                    lines.append(f"{prefix}{key}:")
+                    lines.extend(self._info_lines(value, indent + 2))
+                else:
+                    lines.append(f"{prefix}{key}: {value}")
+        elif isinstance(data, list):
+            for item in data:
+                if isinstance(item, (dict, list)):
+                    lines.extend(self._info_lines(item, indent + 2))
+                else:
+                    lines.append(f"{prefix}{item}")
+        return lines
 
     def system_cleanup(self):
         """Limpia recursos no utilizados"""
-        print("\n🧹 LIMPIEZA DEL SISTEMA")
-        print("Esto eliminará:")
-        print("- Contenedores detenidos")
-        print("- Redes no utilizadas")
-        print("- Imágenes sin referencia")
-        print("- Caché de construcción")
+        emit("\n🧹 LIMPIEZA DEL SISTEMA",
+             "Esto eliminará:",
+             "- Contenedores detenidos",
+             "- Redes no utilizadas",
+             "- Imágenes sin referencia",
+             "- Caché de construcción")
 
         confirm = input("\n¿Continuar con la limpieza? (s/N): ").strip().lower()
         if confirm == 's':
@@ -288,9 +907,65 @@ class SystemManager:
 
     def disk_usage(self):
         """Muestra uso de disco de Docker"""
-        print("\n💾 USO DE DISCO DOCKER:")
-        print("-" * 40)
-        self.dm.run_command_interactive(['docker', 'system', 'df'])
+        header = ("\n💾 USO DE DISCO DOCKER:", "-" * 40)
+
+        if self.dm.client:
+            try:
+                usage = self.dm.cached_api(self.dm.client.api.df)
+            except SDK_ERRORS as e:
+                emit(*header, f"❌ Error ejecutando comando: {e}")
+                return
+            emit(*header, render_table(self._usage_rows(usage),
+                                       [('TYPE', 'Type'), ('TOTAL', 'Total'), ('ACTIVE', 'Active'),
+                                        ('SIZE', 'Size'), ('RECLAIMABLE', 'Reclaimable')]))
+            return
+
+        self._show_query(header, ['docker', 'system', 'df'])
+
+    def _usage_rows(self, usage: Dict) -> List[Dict]:
+        """Resume la respuesta de /system/df en las filas que muestra `docker system df`"""
+        images = usage.get('Images') or []
+        containers = usage.get('Containers') or []
+        volumes = usage.get('Volumes') or []
+        build_cache = usage.get('BuildCache') or []
+
+        def volume_size(volume):
+            return max(volume.get('UsageData', {}).get('Size', 0), 0)
+
+        def volume_in_use(volume):
+            return volume.get('UsageData', {}).get('RefCount', 0) > 0
+
+        def container_active(container):
+            return container.get('State') in ('running', 'paused')
+
+        # Igual que la CLI: lo recuperable de las imágenes es el total de capas
+        # menos el tamaño propio de las imágenes usadas por algún contenedor
+        layers_size = usage.get('LayersSize', 0)
+        images_used = sum(i['Size'] - i['SharedSize'] for i in images
+                          if i.get('Containers', 0) != 0 and i.get('Size', -1) != -1
+                          and i.get('SharedSize', -1) != -1)
+        unshared_cache = [b for b in build_cache if not b.get('Shared')]
+
+        summary = [
+            ('Images', len(images), sum(1 for i in images if i.get('Containers', 0) > 0),
+             layers_size, max(layers_size - images_used, 0)),
+            ('Containers', len(containers), sum(1 for c in containers if container_active(c)),
+             sum(c.get('SizeRw', 0) for c in containers),
+             sum(c.get('SizeRw', 0) for c in containers if not container_active(c))),
+            ('Local Volumes', len(volumes), sum(1 for v in volumes if volume_in_use(v)),
+             sum(volume_size(v) for v in volumes),
+             sum(volume_size(v) for v in volumes if not volume_in_use(v))),
+            ('Build Cache', len(build_cache), sum(1 for b in build_cache if b.get('InUse')),
+             sum(b.get('Size', 0) for b in unshared_cache),
+             sum(b.get('Size', 0) for b in unshared_cache if not b.get('InUse'))),
+        ]
+
+        rows = []
+        for kind, total, active, size, reclaimable in summary:
+            percent = f" ({reclaimable * 100 // size}%)" if size else ""
+            rows.append({'Type': kind, 'Total': total, 'Active': active, 'Size': format_size(size),
+                         'Reclaimable': format_size(reclaimable) + percent})
+        return rows
 
 
 class DockerCLI:
@@ -301,59 +976,65 @@ class DockerCLI:
         self.image_manager = ImageManager(self.docker_manager)
         self.container_manager = ContainerManager(self.docker_manager)
         self.system_manager = SystemManager(self.docker_manager)
+        self._header = HEADER.format(version=self.docker_manager.docker_version)
+
+        # Acciones de cada menú por opción; las de "volver" y "salir" se tratan aparte
+        self._main_actions = {
+            '1': self.handle_image_menu,
+            '2': self.handle_container_menu,
+            '3': self.handle_system_menu,
+        }
+        self._image_actions = {
+            '1': self.image_manager.list_images,
+            '2': self.image_manager.pull_image,
+            '3': self.image_manager.build_image,
+            '4': self.image_manager.remove_image,
+        }
+        self._container_actions = {
+            '1': lambda: self.container_manager.list_containers(all_containers=False),
+            '2': lambda: self.container_manager.list_containers(all_containers=True),
+            '3': self.container_manager.run_container,
+            '4': self.container_manager.start_container,
+            '5': self.container_manager.stop_container,
+            '6': self.container_manager.restart_container,
+            '7': self.container_manager.remove_container,
+            '8': self.container_manager.view_logs,
+            '9': self.container_manager.exec_container,
+        }
+        self._system_actions = {
+            '1': self.system_manager.system_info,
+            '2': self.system_manager.disk_usage,
+            '3': self.system_manager.system_cleanup,
+        }
+
+        if os.name == 'nt':
+            # Activa el procesamiento de secuencias ANSI en la consola de Windows
+            os.system('')
 
     def clear_screen(self):
         """Limpia la pantalla"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
 
     def show_header(self):
         """Muestra el encabezado de la aplicación"""
-        print("=" * 60)
-        print("🐳 DOCKER MANAGEMENT CLI")
-        print("=" * 60)
+        sys.stdout.write(self._header)
 
     def show_main_menu(self):
         """Muestra el menú principal"""
-        print("\n📋 MENÚ PRINCIPAL:")
-        print("1. 📦 Gestión de Imágenes")
-        print("2. 🐳 Gestión de Contenedores")
-        print("3. 🔧 Información del Sistema")
-        print("4. 🚪 Salir")
-        print("-" * 30)
+        sys.stdout.write(MAIN_MENU)
 
     def show_image_menu(self):
         """Muestra el menú de gestión de imágenes"""
-        print("\n📦 GESTIÓN DE IMÁGENES:")
-        print("1. 📋 Listar todas las imágenes")
-        print("2. ⬇️ Descargar imagen")
-        print("3. 🔨 Construir imagen")
-        print("4. 🗑️ Eliminar imagen")
-        print("5. ⬅️ Volver al menú principal")
-        print("-" * 35)
+        sys.stdout.write(IMAGE_MENU)
 
     def show_container_menu(self):
         """Muestra el menú de gestión de contenedores"""
-        print("\n🐳 GESTIÓN DE CONTENEDORES:")
-        print("1. 📋 Listar contenedores activos")
-        print("2. 📋 Listar todos los contenedores")
-        print("3. 🚀 Ejecutar nuevo contenedor")
-        print("4. ▶️ Iniciar contenedor")
-        print("5. ⏹️ Detener contenedor")
-        print("6. 🔄 Reiniciar contenedor")
-        print("7. 🗑️ Eliminar contenedor")
-        print("8. 📄 Ver logs de contenedor")
-        print("9. 💻 Ejecutar comando en contenedor")
-        print("10. ⬅️ Volver al menú principal")
-        print("-" * 40)
+        sys.stdout.write(CONTAINER_MENU)
 
     def show_system_menu(self):
         """Muestra el menú de sistema"""
-        print("\n🔧 INFORMACIÓN DEL SISTEMA:")
-        print("1. 📊 Información del sistema Docker")
-        print("2. 💾 Uso de disco")
-        print("3. 🧹 Limpiar sistema")
-        print("4. ⬅️ Volver al menú principal")
-        print("-" * 35)
+        sys.stdout.write(SYSTEM_MENU)
 
     def handle_image_menu(self):
         """Maneja el menú de imágenes"""
@@ -361,18 +1042,12 @@ class DockerCLI:
             self.show_image_menu()
             choice = input("Selecciona una opción: ").strip()
 
-            if choice == '1':
-                self.image_manager.list_images()
-            elif choice == '2':
-                self.image_manager.pull_image()
-            elif choice == '3':
-                self.image_manager.build_image()
-            elif choice == '4':
-                self.image_manager.remove_image()
+            if choice not in IMAGE_CHOICES:
+                print("❌ Opción inválida")
             elif choice == '5':
                 break
             else:
-                print("❌ Opción inválida")
+                self._image_actions[choice]()
 
             input("\nPresiona Enter para continuar...")
 
@@ -382,28 +1057,12 @@ class DockerCLI:
             self.show_container_menu()
             choice = input("Selecciona una opción: ").strip()
 
-            if choice == '1':
-                self.container_manager.list_containers(all_containers=False)
-            elif choice == '2':
-                self.container_manager.list_containers(all_containers=True)
-            elif choice == '3':
-                self.container_manager.run_container()
-            elif choice == '4':
-                self.container_manager.start_container()
-            elif choice == '5':
-                self.container_manager.stop_container()
-            elif choice == '6':
-                self.container_manager.restart_container()
-            elif choice == '7':
-                self.container_manager.remove_container()
-            elif choice == '8':
-                self.container_manager.view_logs()
-            elif choice == '9':
-                self.container_manager.exec_container()
+            if choice not in CONTAINER_CHOICES:
+                print("❌ Opción inválida")
             elif choice == '10':
                 break
             else:
-                print("❌ Opción inválida")
+                self._container_actions[choice]()
 
             input("\nPresiona Enter para continuar...")
 
@@ -413,44 +1072,39 @@ class DockerCLI:
             self.show_system_menu()
             choice = input("Selecciona una opción: ").strip()
 
-            if choice == '1':
-                self.system_manager.system_info()
-            elif choice == '2':
-                self.system_manager.disk_usage()
-            elif choice == '3':
-                self.system_manager.system_cleanup()
+            if choice not in SYSTEM_CHOICES:
+                print("❌ Opción inválida")
             elif choice == '4':
                 break
             else:
-                print("❌ Opción inválida")
+                self._system_actions[choice]()
 
             input("\nPresiona Enter para continuar...")
 
     def run(self):
         """Ejecuta la aplicación principal"""
+        self.docker_manager.start_event_listener()
         try:
             while True:
                 self.show_header()
                 self.show_main_menu()
                 choice = input("Selecciona una opción: ").strip()
 
-                if choice == '1':
-                    self.handle_image_menu()
-                elif choice == '2':
-                    self.handle_container_menu()
-                elif choice == '3':
-                    self.handle_system_menu()
+                if choice not in MAIN_CHOICES:
+                    print("❌ Opción inválida")
+                    input("\nPresiona Enter para continuar...")
                 elif choice == '4':
                     print("\n👋 ¡Gracias por usar Docker Management CLI!")
                     break
                 else:
-                    print("❌ Opción inválida")
-                    input("\nPresiona Enter para continuar...")
+                    self._main_actions[choice]()
 
         except KeyboardInterrupt:
             print("\n\n👋 Aplicación terminada por el usuario")
         except Exception as e:
             print(f"\n❌ Error inesperado: {e}")
+        finally:
+            self.docker_manager.stop_event_listener()
 
 
 def main():